@@ -76,18 +76,36 @@ whose first operands are instances of the classes declaring those methods).
 '''
 
 # ....................{ STRINGS                            }....................
-@contextmanager
-def _noop_context_manager() -> Iterator[None]:
+def _get_contextlib_contextmanager_codeobj_name() -> str:
     '''
-    Arbitrary :func:`contextlib.contextmanager`-based context manager defined
-    solely to inspect various dunder attributes common to all such managers.
+    Fully-qualified name of the code object underlying the isomorphic decorator
+    closure created and returned by the :func:`contextlib.contextmanager`
+    decorator.
+
+    This getter is intentionally called exactly once at module scope below.
+    Declaring the throwaway context manager inspected by this getter as a local
+    rather than global attribute of this submodule ensures that context manager
+    is implicitly garbage-collected on returning *without* temporarily
+    polluting the namespace of this submodule.
     '''
 
-    yield
+    @contextmanager
+    def _noop_context_manager() -> Iterator[None]:
+        '''
+        Arbitrary :func:`contextlib.contextmanager`-based context manager
+        defined solely to inspect various dunder attributes common to all such
+        managers.
+        '''
+
+        yield
+
+    # Return the fully-qualified name of the code object underlying this
+    # context manager.
+    return get_func_codeobj_name(_noop_context_manager)
 
 
-CONTEXTLIB_CONTEXTMANAGER_CODEOBJ_NAME = get_func_codeobj_name(
-    _noop_context_manager)
+CONTEXTLIB_CONTEXTMANAGER_CODEOBJ_NAME = (
+    _get_contextlib_contextmanager_codeobj_name())
 '''
 Fully-qualified name of the code object underlying the isomorphic decorator
 closure created and returned by the :func:`contextlib.contextmanager` decorator.
@@ -124,6 +142,6 @@ masquerading as the decorated generator factory function. Only the secretive
 # print(f'CONTEXTLIB_CONTEXTMANAGER_CODEOBJ_NAME: {CONTEXTLIB_CONTEXTMANAGER_CODEOBJ_NAME}')
 
 
-# Delete this context manager now that we no longer require it as a negligible
-# safety (and possible space complexity) measure.
-del _noop_context_manager
+# Delete this getter now that we no longer require it as a negligible safety
+# (and possible space complexity) measure.
+del _get_contextlib_contextmanager_codeobj_name
@@ -15,20 +15,15 @@ from beartype.roar._roarexc import _BeartypeUtilCallableException
 from beartype.typing import (
     TYPE_CHECKING,
     Any,
+    Dict,
+    Tuple,
 )
 from beartype._data.func.datafunc import CONTEXTLIB_CONTEXTMANAGER_CODEOBJ_NAME
 from beartype._data.datatyping import (
     Codeobjable,
     TypeException,
 )
-from beartype._util.func.arg.utilfuncargtest import (
-    is_func_arg_variadic_positional,
-    is_func_arg_variadic_keyword,
-)
-from beartype._util.func.utilfunccodeobj import (
-    get_func_codeobj_or_none,
-    get_func_codeobj_name,
-)
+from beartype._util.func.utilfunccodeobj import get_func_codeobj_or_none
 from beartype._util.hint.utilhintfactory import TypeHintTypeFactory
 from beartype._util.mod.lib.utiltyping import import_typing_attr_or_fallback
 from beartype._util.py.utilpyversion import IS_PYTHON_AT_MOST_3_10
@@ -40,6 +35,19 @@ from inspect import (
     CO_ASYNC_GENERATOR,
     CO_COROUTINE,
     CO_GENERATOR,
+    CO_VARARGS,
+    CO_VARKEYWORDS,
+)
+from types import (
+    BuiltinFunctionType,
+    ClassMethodDescriptorType,
+    CodeType,
+    FrameType,
+    FunctionType,
+    GeneratorType,
+    MethodDescriptorType,
+    MethodWrapperType,
+    WrapperDescriptorType,
 )
 
 #FIXME: DRY violation. This logic is duplicated from the
@@ -140,12 +148,7 @@ def die_unless_func_python(
 
     # If this callable is *NOT* pure-Python, raise an exception.
     if not is_func_python(func):
-        assert isinstance(exception_cls, type), (
-            f'{repr(exception_cls)} not class.')
-        assert issubclass(exception_cls, Exception), (
-            f'{repr(exception_cls)} not exception subclass.')
-        assert isinstance(exception_prefix, str), (
-            f'{repr(exception_prefix)} not string.')
+        assert _is_exception_params_valid(exception_cls, exception_prefix)
 
         # If this callable is uncallable, raise an appropriate exception.
         if not callable(func):
@@ -198,12 +201,7 @@ def die_unless_func_classmethod(
 
     # If this object is *NOT* a class method descriptor, raise an exception.
     if not is_func_classmethod(func):
-        assert isinstance(exception_cls, type), (
-            f'{repr(exception_cls)} not class.')
-        assert issubclass(exception_cls, Exception), (
-            f'{repr(exception_cls)} not exception subclass.')
-        assert isinstance(exception_prefix, str), (
-            f'{repr(exception_prefix)} not string.')
+        assert _is_exception_params_valid(exception_cls, exception_prefix)
 
         # Raise a human-readable exception.
         raise exception_cls(
@@ -252,12 +250,7 @@ def die_unless_func_property(
 
     # If this object is *NOT* a property method descriptor, raise an exception.
     if not is_func_property(func):
-        assert isinstance(exception_cls, type), (
-            f'{repr(exception_cls)} not class.')
-        assert issubclass(exception_cls, Exception), (
-            f'{repr(exception_cls)} not exception subclass.')
-        assert isinstance(exception_prefix, str), (
-            f'{repr(exception_prefix)} not string.')
+        assert _is_exception_params_valid(exception_cls, exception_prefix)
 
         # Raise a human-readable exception.
         raise exception_cls(
@@ -307,12 +300,7 @@ def die_unless_func_staticmethod(
 
     # If this object is *NOT* a static method descriptor, raise an exception.
     if not is_func_staticmethod(func):
-        assert isinstance(exception_cls, type), (
-            f'{repr(exception_cls)} not class.')
-        assert issubclass(exception_cls, Exception), (
-            f'{repr(exception_cls)} not exception subclass.')
-        assert isinstance(exception_prefix, str), (
-            f'{repr(exception_prefix)} not string.')
+        assert _is_exception_params_valid(exception_cls, exception_prefix)
 
         # Raise a human-readable exception.
         raise exception_cls(
@@ -340,9 +328,13 @@ def is_func_lambda(func: Any) -> bool:
     '''
 
     # Return true only if this both...
+    #
+    # Note that this tester intentionally tests the name of this callable
+    # *BEFORE* testing whether this callable is pure-Python. Since most
+    # callables are *NOT* lambda functions, the former trivial string
+    # comparison rejects most callables without requiring the latter
+    # comparatively non-trivial test.
     return (
-        # This callable is pure-Python *AND*...
-        is_func_python(func) and
         # This callable's name is the lambda-specific placeholder name
         # initially given by Python to *ALL* lambda functions. Technically,
         # this name may be externally changed by malicious third parties after
@@ -353,7 +345,12 @@ def is_func_lambda(func: Any) -> bool:
         # sane) means of differentiating lambda from non-lambda callables.
         # Alternatives require AST-based parsing, which comes with its own
         # substantial caveats, concerns, and edge cases.
-        func.__name__ == FUNC_NAME_LAMBDA
+        #
+        # Note that objects need *NOT* define the "__name__" dunder attribute
+        # (e.g., code objects, call stack frames), necessitating a fallback.
+        getattr(func, '__name__', None) == FUNC_NAME_LAMBDA and
+        # This callable is pure-Python.
+        is_func_python(func)
     )
 
 
@@ -375,6 +372,33 @@ def is_func_python(func: object) -> TypeGuard[Callable]:
         :data:`True` only if this object is a pure-Python callable
     '''
 
+    # Either "True" or "False" if the type of this object alone decides whether
+    # this object is pure-Python *OR* "None" otherwise.
+    #
+    # Note that this fast path intentionally:
+    # * Calls the type() builtin rather than accessing the "__class__" dunder
+    #   attribute, which proxy objects (e.g., "unittest.mock.Mock") may spoof.
+    # * Avoids calling the general-purpose get_func_codeobj_or_none() getter
+    #   for the common case of plain functions, reducing this tester to a
+    #   single dictionary lookup. That getter performs a function-local import
+    #   and a chain of isinstance() calls and is thus comparatively slow.
+    # * Guards this lookup against unhashable types (e.g., classes whose
+    #   metaclasses define the __eq__() but *NOT* __hash__() dunder methods).
+    #   Since entering a "try" block is trivial (and entirely free under Python
+    #   >= 3.11), this guard imposes negligible cost on the common case.
+    try:
+        is_python = _FUNC_TYPE_TO_IS_PYTHON.get(type(func))
+    # If the type of this object is unhashable, silently reduce to a noop. Since
+    # no unhashable type is a key of this dictionary, the fallback below then
+    # decides this test.
+    except TypeError:
+        is_python = None
+
+    # If the type of this object decides this test, return that boolean.
+    if is_python is not None:
+        return is_python
+    # Else, the type of this object does *NOT* decide this test.
+
     # Return true only if a pure-Python code object underlies this object.
     # C-based callables are associated with *NO* code objects.
     return get_func_codeobj_or_none(func) is not None
@@ -507,40 +531,13 @@ def is_func_async(func: object) -> TypeGuard[Callable]:
         Stdlib functions strongly inspiring this implementation.
     '''
 
-    # Code object underlying this pure-Python callable if any *OR* "None".
+    # Return true only if this object is a pure-Python callable whose code
+    # object implies this callable to be either an asynchronous coroutine *OR*
+    # asynchronous generator.
     #
-    # Note this tester intentionally:
-    # * Inlines the tests performed by the is_func_coro() and
-    #   is_func_async_generator() testers for efficiency.
-    # * Calls the get_func_codeobj_or_none() with "is_unwrap" disabled
-    #   rather than enabled. Why? Because the asynchronicity of this possibly
-    #   higher-level wrapper has *NO* relation to that of the possibly
-    #   lower-level wrappee wrapped by this wrapper. Notably, it is both
-    #   feasible and commonplace for third-party decorators to enable:
-    #   * Synchronous callables to be called asynchronously by wrapping
-    #     synchronous callables with asynchronous closures.
-    #   * Asynchronous callables to be called synchronously by wrapping
-    #     asynchronous callables with synchronous closures. Indeed, our
-    #     top-level "conftest.py" pytest plugin does exactly this -- enabling
-    #     asynchronous tests to be safely called by pytest's currently
-    #     synchronous framework.
-    func_codeobj = get_func_codeobj_or_none(func)
-
-    # If this object is *NOT* a pure-Python callable, immediately return false.
-    if func_codeobj is None:
-        return False
-    # Else, this object is a pure-Python callable.
-
-    # Bit field of OR-ed binary flags describing this callable.
-    func_codeobj_flags = func_codeobj.co_flags
-
-    # Return true only if these flags imply this callable to be either...
-    return (
-        # An asynchronous coroutine *OR*...
-        func_codeobj_flags & CO_COROUTINE != 0 or
-        # An asynchronous generator.
-        func_codeobj_flags & CO_ASYNC_GENERATOR != 0
-    )
+    # Note this tester intentionally inlines the tests performed by the
+    # is_func_coro() and is_func_async_generator() testers for efficiency.
+    return _get_func_codeobj_flags(func) & _CO_FLAGS_ASYNC != 0
 
 
 def is_func_coro(func: object) -> TypeGuard[Callable]:
@@ -568,17 +565,9 @@ def is_func_coro(func: object) -> TypeGuard[Callable]:
         Stdlib function strongly inspiring this implementation.
     '''
 
-    # Code object underlying this pure-Python callable if any *OR* "None".
-    func_codeobj = get_func_codeobj_or_none(func)
-
-    # Return true only if...
-    return (
-        # This object is a pure-Python callable *AND*...
-        func_codeobj is not None and
-        # This callable's code object implies this callable to be an
-        # asynchronous coroutine.
-        func_codeobj.co_flags & CO_COROUTINE != 0
-    )
+    # Return true only if this object is a pure-Python callable whose code
+    # object implies this callable to be an asynchronous coroutine.
+    return _get_func_codeobj_flags(func) & CO_COROUTINE != 0
 
 
 def is_func_async_generator(func: object) -> TypeGuard[Callable]:
@@ -606,17 +595,9 @@ def is_func_async_generator(func: object) -> TypeGuard[Callable]:
         Stdlib function strongly inspiring this implementation.
     '''
 
-    # Code object underlying this pure-Python callable if any *OR* "None".
-    func_codeobj = get_func_codeobj_or_none(func)
-
-    # Return true only if...
-    return (
-        # This object is a pure-Python callable *AND*...
-        func_codeobj is not None and
-        # This callable's code object implies this callable to be an
-        # asynchronous generator.
-        func_codeobj.co_flags & CO_ASYNC_GENERATOR != 0
-    )
+    # Return true only if this object is a pure-Python callable whose code
+    # object implies this callable to be an asynchronous generator.
+    return _get_func_codeobj_flags(func) & CO_ASYNC_GENERATOR != 0
 
 # ....................{ TESTERS ~ sync                     }....................
 def is_func_sync_generator(func: object) -> TypeGuard[Callable]:
@@ -659,17 +640,9 @@ def is_func_sync_generator(func: object) -> TypeGuard[Callable]:
         return False
     # Else, this object is callable.
 
-    # Code object underlying this pure-Python callable if any *OR* "None".
-    func_codeobj = get_func_codeobj_or_none(func)
-
-    # Return true only if...
-    return (
-        # This object is a pure-Python callable *AND*...
-        func_codeobj is not None and
-        # This callable's code object implies this callable to be a
-        # synchronous generator.
-        func_codeobj.co_flags & CO_GENERATOR != 0
-    )
+    # Return true only if this object is a pure-Python callable whose code
+    # object implies this callable to be a synchronous generator.
+    return _get_func_codeobj_flags(func) & CO_GENERATOR != 0
 
 # ....................{ TESTERS : nested                   }....................
 def is_func_nested(func: Callable) -> bool:
@@ -801,28 +774,79 @@ def is_func_closure_isomorphic(func: Any) -> TypeGuard[Callable]:
     '''
 
     # If the passed callable is *NOT* a closure, immediately return false.
-    if not is_func_closure(func):
+    #
+    # Note that this tester intentionally inlines the test performed by the
+    # is_func_closure() tester for efficiency. Since most callables are *NOT*
+    # closures, this test rejects most callables.
+    if getattr(func, '__closure__', None) is None:
         return False
     # Else, that callable is a closure.
 
-    # Code object underlying that callable as is (rather than possibly unwrapped
-    # to another code object entirely) if that callable is pure-Python *OR*
-    # "None" otherwise (i.e., if that callable is C-based).
-    func_codeobj = get_func_codeobj_or_none(func)
-
-    # Return true only if...
+    # Return true only if that callable accepts both a variadic positional
+    # argument *AND* a variadic keyword argument. Since the flags of C-based
+    # callables reduce to 0, this test also rejects C-based callables.
+    #
+    # Note that this tester intentionally inlines the tests performed by the
+    # is_func_arg_variadic_positional() and is_func_arg_variadic_keyword()
+    # testers for efficiency.
     return (
-        # That callable is pure-Python *AND*...
-        func_codeobj is not None and
-        # That callable accepts a variadic positional argument *AND*...
-        is_func_arg_variadic_positional(func_codeobj) and
-        # That callable accepts a variadic keyword argument.
-        is_func_arg_variadic_keyword(func_codeobj)
+        _get_func_codeobj_flags(func) & _CO_FLAGS_VARIADIC ==
+        _CO_FLAGS_VARIADIC
     )
 
 
-def is_func_contextlib_contextmanager(func: Any) -> TypeGuard[Callable]:
-    '''
+# If the active Python interpreter targets Python < 3.11 and thus fails to
+# define the "co_qualname" attribute on code objects required to robustly
+# implement this tester, reduce this tester to unconditionally return false.
+if IS_PYTHON_AT_MOST_3_10:
+    def is_func_contextlib_contextmanager(func: Any) -> TypeGuard[Callable]:
+
+        # Return false. See above for further details.
+        return False
+# Else, the active Python interpreter targets Python >= 3.11 and thus defines
+# the "co_qualname" attribute on code objects. In this case, implement this
+# tester in full.
+else:
+    def is_func_contextlib_contextmanager(func: Any) -> TypeGuard[Callable]:
+
+        # If the passed callable is *NOT* a closure, immediately return false.
+        #
+        # Note that this tester intentionally inlines the test performed by
+        # the is_func_closure() tester for efficiency.
+        if getattr(func, '__closure__', None) is None:
+            return False
+        # Else, that callable is a closure.
+
+        # Code object underlying that callable as is (rather than possibly
+        # unwrapped to another code object entirely) if that callable is
+        # pure-Python *OR* "None" otherwise (i.e., if that callable is C-based).
+        func_codeobj = get_func_codeobj_or_none(func)
+
+        # If that callable is C-based, immediately return false.
+        if func_codeobj is None:
+            return False
+        # Else, that callable is pure-Python.
+
+        # Fully-qualified name of that code object.
+        #
+        # Note that this tester intentionally accesses the "co_qualname"
+        # attribute directly rather than calling the get_func_codeobj_name()
+        # getter, which this implementation of this tester already guarantees
+        # to return this attribute.
+        func_codeobj_name = func_codeobj.co_qualname  # type: ignore[attr-defined]
+
+        # Return true only if the fully-qualified name of that code object is
+        # that of the isomorphic decorator closure created and returned by the
+        # standard @contextlib.contextmanager decorator.
+        #
+        # Note that we *COULD* technically also explicitly test whether that
+        # callable satisfies the is_func_closure_isomorphic() tester, but that
+        # there's no benefit and a minor efficiency cost  to doing so.
+        return func_codeobj_name == CONTEXTLIB_CONTEXTMANAGER_CODEOBJ_NAME
+
+
+# Document this tester regardless of implementation details above.
+is_func_contextlib_contextmanager.__doc__ = '''
     :data:`True` only if the passed object is a
     :func:`contextlib.contextmanager`-based **isomorphic decorator closure**
     (i.e., closure both defined and returned by the standard
@@ -853,37 +877,208 @@ def is_func_contextlib_contextmanager(func: Any) -> TypeGuard[Callable]:
         Further discussion.
     '''
 
-    # If either...
-    if (
-        # The active Python interpreter targets Python < 3.10 and thus fails to
-        # define the "co_qualname" attribute on code objects required to
-        # robustly implement this test *OR*...
-        IS_PYTHON_AT_MOST_3_10 or
-        # The passed callable is *NOT* a closure...
-        not is_func_closure(func)
-    ):
-        # Then immediately return false.
-        return False
-    # Else, that callable is a closure.
+# ....................{ PRIVATE ~ constants                }....................
+_CO_FLAGS_ASYNC = CO_COROUTINE | CO_ASYNC_GENERATOR
+'''
+Bit field of the OR-ed binary code object flags describing *all* asynchronous
+callable factories (i.e., both asynchronous coroutine factories *and*
+asynchronous generator factories).
+'''
+
+
+_CO_FLAGS_VARIADIC = CO_VARARGS | CO_VARKEYWORDS
+'''
+Bit field of the OR-ed binary code object flags describing *all* callables
+accepting both a variadic positional argument *and* a variadic keyword argument.
+'''
+
+# ....................{ PRIVATE ~ getters                  }....................
+def _get_func_codeobj_flags(func: object) -> int:
+    '''
+    **Code object flags** (i.e., bit field of OR-ed binary flags, each
+    describing a property of the code object underlying the passed object)
+    if this object is pure-Python *or* ``0`` otherwise (e.g., if this object is
+    C-based).
+
+    This getter enables the asynchronous, generator, and closure testers defined
+    by this submodule to share a single code object probe, reducing each such
+    tester to a single bitwise test against the flag(s) of interest.
 
-    # Code object underlying that callable as is (rather than possibly unwrapped
-    # to another code object entirely) if that callable is pure-Python *OR*
-    # "None" otherwise (i.e., if that callable is C-based).
+    Caveats
+    ----------
+    **This getter intentionally avoids unwrapping the passed object** (i.e.,
+    calls the :func:`.get_func_codeobj_or_none` getter with ``is_unwrap``
+    disabled). Why? Because the asynchronicity of this possibly higher-level
+    wrapper has *no* relation to that of the possibly lower-level wrappee
+    wrapped by this wrapper. Notably, it is both feasible and commonplace for
+    third-party decorators to enable:
+
+    * Synchronous callables to be called asynchronously by wrapping synchronous
+      callables with asynchronous closures.
+    * Asynchronous callables to be called synchronously by wrapping
+      asynchronous callables with synchronous closures. Indeed, our top-level
+      ``conftest.py`` pytest plugin does exactly this -- enabling asynchronous
+      tests to be safely called by pytest's currently synchronous framework.
+
+    Parameters
+    ----------
+    func : object
+        Object to be inspected.
+
+    Returns
+    ----------
+    int
+        Either:
+
+        * If this object is pure-Python, the ``co_flags`` bit field of the code
+          object underlying this object.
+        * Else, ``0``.
+    '''
+
+    # If this object is a pure-Python function, return the flags of the code
+    # object underlying this function directly. Since most objects passed to
+    # this getter are functions, this fast path avoids the comparatively slow
+    # general-purpose get_func_codeobj_or_none() getter in the common case.
+    if type(func) is FunctionType:
+        return func.__code__.co_flags
+    # Else, this object is *NOT* a pure-Python function.
+
+    # Code object underlying this pure-Python callable if any *OR* "None".
     func_codeobj = get_func_codeobj_or_none(func)
 
-    # If that callable is C-based, immediately return false.
-    if func_codeobj is None:
-        return False
-    # Else, that callable is pure-Python.
+    # Return either the flags of this code object if any *OR* 0 otherwise.
+    return 0 if func_codeobj is None else func_codeobj.co_flags
 
-    # Fully-qualified name of that code object.
-    func_codeobj_name = get_func_codeobj_name(func_codeobj)
+# ....................{ PRIVATE ~ factories                }....................
+def _make_func_type_to_is_python(
+    func_types_python: Tuple[type, ...],
+    func_types_nonpython: Tuple[type, ...],
+) -> Dict[type, bool]:
+    '''
+    Dictionary mapping from each passed type whose instances are either *all*
+    pure-Python or associated with *no* code objects to :data:`True` if the
+    former *or* :data:`False` otherwise.
+
+    This factory silently omits **aliased types** (i.e., types residing in both
+    passed tuples). Although these types are distinct under CPython, some
+    non-CPython interpreters alias various of these types to one another (e.g.,
+    PyPy, under which *all* functions are C-based). Omitting these types
+    rather than preferring either mapping for them reduces the
+    :func:`.is_func_python` tester to its general-purpose fallback for objects
+    of these types.
 
-    # Return true only if the fully-qualified name of that code object is that
-    # of the isomorphic decorator closure created and returned by the standard
-    # @contextlib.contextmanager decorator.
-    #
-    # Note that we *COULD* technically also explicitly test whether that
-    # callable satisfies the is_func_closure_isomorphic() tester, but that
-    # there's no benefit and a minor efficiency cost  to doing so.
-    return func_codeobj_name == CONTEXTLIB_CONTEXTMANAGER_CODEOBJ_NAME
+    Parameters
+    ----------
+    func_types_python : Tuple[type, ...]
+        Tuple of all types whose instances are *all* pure-Python.
+    func_types_nonpython : Tuple[type, ...]
+        Tuple of all types whose instances are associated with *no* code
+        objects.
+
+    Returns
+    ----------
+    Dict[type, bool]
+        Dictionary mapping from each unaliased type to its pure-Pythonicity.
+    '''
+
+    # Return a new dictionary mapping from each type in these tuples that is
+    # *NOT* aliased across both tuples to whether that type is pure-Python.
+    return {
+        func_type: is_python
+        for func_types, is_python in (
+            (func_types_python, True),
+            (func_types_nonpython, False),
+        )
+        for func_type in func_types
+        if not (
+            func_type in func_types_python and
+            func_type in func_types_nonpython
+        )
+    }
+
+# ....................{ PRIVATE ~ dicts                    }....................
+_FUNC_TYPES_PYTHON = (
+    # Types of pure-Python objects unconditionally associated with code objects.
+    CodeType,
+    FrameType,
+    FunctionType,
+    GeneratorType,
+)
+'''
+Tuple of all types whose instances are *all* pure-Python.
+'''
+
+
+_FUNC_TYPES_NONPYTHON = (
+    # Types of C-based callables and non-callable descriptors unconditionally
+    # associated with *NO* code objects.
+    BuiltinFunctionType,
+    ClassMethodDescriptorType,
+    MethodDescriptorType,
+    MethodWrapperType,
+    WrapperDescriptorType,
+    classmethod,
+    property,
+    staticmethod,
+    type,
+)
+'''
+Tuple of all types whose instances are associated with *no* code objects.
+'''
+
+
+_FUNC_TYPE_TO_IS_PYTHON = _make_func_type_to_is_python(
+    _FUNC_TYPES_PYTHON, _FUNC_TYPES_NONPYTHON)
+'''
+Dictionary mapping from each type whose instances are either *all* pure-Python
+or associated with *no* code objects to :data:`True` if the former *or*
+:data:`False` otherwise.
+
+This dictionary enables the :func:`.is_func_python` tester to decide the common
+case by a single lookup on the exact type of the passed object. This dictionary
+intentionally omits:
+
+* :class:`types.MethodType`, whose instances are pure-Python *only* if the
+  functions they bind are also pure-Python.
+* Types aliased to one another under the active Python interpreter. See the
+  :func:`._make_func_type_to_is_python` factory.
+
+This dictionary is intentionally *not* populated dynamically, as doing so would
+retain strong references to arbitrary user-defined types.
+'''
+
+# ....................{ PRIVATE ~ testers                  }....................
+def _is_exception_params_valid(
+    exception_cls: TypeException, exception_prefix: str) -> bool:
+    '''
+    :data:`True` only if the passed exception type and prefix are valid
+    parameters to be passed to the validators defined by this submodule *or*
+    raise an :exc:`AssertionError` otherwise.
+
+    This tester is intended to be called *only* as the sole expression of an
+    ``assert`` statement (e.g., ``assert _is_exception_params_valid(...)``),
+    ensuring that Python elides *all* calls to this tester under the ``-O``
+    optimization flag.
+
+    Parameters
+    ----------
+    exception_cls : TypeException
+        Type of exception to be validated.
+    exception_prefix : str
+        Human-readable label to be validated.
+
+    Returns
+    ----------
+    bool
+        :data:`True` unconditionally.
+    '''
+
+    assert isinstance(exception_cls, type), (
+        f'{repr(exception_cls)} not class.')
+    assert issubclass(exception_cls, Exception), (
+        f'{repr(exception_cls)} not exception subclass.')
+    assert isinstance(exception_prefix, str), (
+        f'{repr(exception_prefix)} not string.')
+
+    # Return true, thus satisfying the parent "assert" statement.
+    return True
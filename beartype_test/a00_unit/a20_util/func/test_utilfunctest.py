@@ -25,6 +25,7 @@ def test_is_func_lambda() -> None:
 
     # Defer test-specific imports.
     from beartype._util.func.utilfunctest import is_func_lambda
+    from sys import _getframe
 
     def intimations_of_immortality(): 'from Recollections of Early Childhood'
 
@@ -37,6 +38,13 @@ def test_is_func_lambda() -> None:
     # Assert this tester rejects C-based callables.
     assert is_func_lambda(iter) is False
 
+    # Assert this tester rejects pure-Python objects associated with code
+    # objects but defining *NO* "__name__" dunder attribute, including code
+    # objects of both lambda and non-lambda functions and call stack frames.
+    assert is_func_lambda((lambda: True).__code__) is False
+    assert is_func_lambda(intimations_of_immortality.__code__) is False
+    assert is_func_lambda(_getframe()) is False
+
 # ....................{ TESTS ~ testers : async            }....................
 def test_is_func_async() -> None:
     '''
@@ -404,12 +412,107 @@ def test_is_func_python() -> None:
 
     # Defer test-specific imports.
     from beartype._util.func.utilfunctest import is_func_python
+    from beartype_test.a00_unit.data.data_type import (
+        CALLABLES_C,
+        Class,
+        function,
+        sync_generator,
+    )
+
+    # ....................{ LOCALS                         }....................
+    class UnhashableMetaclass(type):
+        '''
+        Metaclass defining the :meth:`__eq__` but *not* :meth:`__hash__` dunder
+        method, implicitly rendering all classes with this metaclass
+        unhashable.
+        '''
 
+        def __eq__(cls, other: object) -> bool:
+            return NotImplemented
+
+
+    class UnhashableCallable(metaclass=UnhashableMetaclass):
+        '''
+        Class whose type is unhashable and whose instances are callable.
+        '''
+
+        def __call__(self) -> None:
+            pass
+
+    # ....................{ PASS                           }....................
     # Assert this tester accepts pure-Python callables.
     assert is_func_python(lambda: True) is True
+    assert is_func_python(function) is True
+    assert is_func_python(Class().instance_method) is True
+
+    # Assert this tester accepts pure-Python non-callables associated with
+    # code objects.
+    assert is_func_python(function.__code__) is True
+    assert is_func_python(sync_generator) is True
 
     # Assert this tester rejects C-based callables.
     assert is_func_python(iter) is False
+    for callable_c in CALLABLES_C:
+        assert is_func_python(callable_c) is False
+
+    # Assert this tester rejects classes, descriptors, and arbitrary objects
+    # associated with *NO* code objects.
+    assert is_func_python(Class) is False
+    assert is_func_python(staticmethod(function)) is False
+    assert is_func_python('Of glory, and of good, and sweetest peace,') is False
+
+    # Assert this tester rejects instances of unhashable types rather than
+    # raising an exception.
+    assert is_func_python(UnhashableCallable()) is False
+
+
+def test_is_func_python_aliased(monkeypatch) -> None:
+    '''
+    Test the
+    :func:`beartype._util.func.utilfunctest.is_func_python` tester under a
+    simulated non-CPython interpreter aliasing the type of pure-Python functions
+    to the type of C-based callables.
+
+    Parameters
+    ----------
+    monkeypatch : MonkeyPatch
+        Builtin fixture object permitting object attributes to be safely
+        modified for the duration of this test.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.func import utilfunctest
+    from beartype._util.func.utilfunctest import (
+        _FUNC_TYPES_NONPYTHON,
+        _FUNC_TYPES_PYTHON,
+        _make_func_type_to_is_python,
+        is_func_python,
+    )
+    from beartype_test.a00_unit.data.data_type import function
+    from types import FunctionType
+
+    # Dictionary mapping from function types to their pure-Pythonicity, created
+    # as if the type of pure-Python functions were also the type of a C-based
+    # callable under the active Python interpreter.
+    func_type_to_is_python = _make_func_type_to_is_python(
+        _FUNC_TYPES_PYTHON, _FUNC_TYPES_NONPYTHON + (FunctionType,))
+
+    # Assert this factory omitted this aliased type but *NOT* unaliased types.
+    assert FunctionType not in func_type_to_is_python
+    assert func_type_to_is_python[type] is False
+    assert len(func_type_to_is_python) == (
+        len(_FUNC_TYPES_PYTHON) + len(_FUNC_TYPES_NONPYTHON) - 1)
+
+    # Temporarily replace the dictionary consulted by this tester with this
+    # dictionary.
+    monkeypatch.setattr(
+        utilfunctest, '_FUNC_TYPE_TO_IS_PYTHON', func_type_to_is_python)
+
+    # Assert this tester still correctly decides objects of this aliased type by
+    # deferring to its general-purpose fallback.
+    assert is_func_python(function) is True
+    assert is_func_python(lambda: True) is True
+    assert is_func_python(iter) is False
 
 # ....................{ TESTS ~ closure                    }....................
 def test_is_func_closure() -> None:
@@ -53,6 +53,22 @@ class HintPithSatisfiedMetadata(object):
         passing this value to the decorated callable). Defaults to ``False``.
     '''
 
+    # ..................{ CLASS VARIABLES                    }..................
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # CAUTION: Subclasses declaring uniquely subclass-specific instance
+    # variables *MUST* additionally slot those variables. Subclasses violating
+    # this constraint will be usable but unslotted, which defeats our purposes.
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+    # Slot all instance variables defined on this object to reduce the space
+    # and time costs of the thousands of instances of this class and subclasses
+    # thereof instantiated at test collection time.
+    __slots__ = (
+        'is_context_manager',
+        'is_pith_factory',
+        'pith',
+    )
+
     # ..................{ INITIALIZERS                       }..................
     def __init__(
         self,
@@ -105,15 +121,28 @@ class HintPithUnsatisfiedMetadata(HintPithSatisfiedMetadata):
         returning this ``pith``. Defaults to the empty tuple.
     '''
 
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object.
+    __slots__ = (
+        'exception_str_match_regexes',
+        'exception_str_not_match_regexes',
+    )
+
     # ..................{ INITIALIZERS                       }..................
     def __init__(
         self,
-        *args,
+
+        # Mandatory parameters.
+        pith: object,
 
         # Optional parameters.
+        is_context_manager: bool = False,
+        is_pith_factory: bool = False,
+
+        # Optional keyword-only parameters.
+        *,
         exception_str_match_regexes: 'Iterable[str]' = (),
         exception_str_not_match_regexes: 'Iterable[str]' = (),
-        **kwargs
     ) -> None:
         assert isinstance(exception_str_match_regexes, Iterable), (
             f'{repr(exception_str_match_regexes)} not iterable.')
@@ -129,8 +158,12 @@ class HintPithUnsatisfiedMetadata(HintPithSatisfiedMetadata):
                 exception_str_not_match_regexes)
         ), f'{repr(exception_str_not_match_regexes)} not iterable of regexes.'
 
-        # Initialize our superclass with all variadic parameters.
-        super().__init__(*args, **kwargs)
+        # Initialize our superclass with all superclass-specific parameters.
+        super().__init__(
+            pith=pith,
+            is_context_manager=is_context_manager,
+            is_pith_factory=is_pith_factory,
+        )
 
         # Classify all remaining passed parameters.
         self.exception_str_not_match_regexes = exception_str_not_match_regexes
@@ -198,6 +231,25 @@ class HintNonpepMetadata(object):
         the empty tuple.
     '''
 
+    # ..................{ CLASS VARIABLES                    }..................
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+    # CAUTION: Subclasses declaring uniquely subclass-specific instance
+    # variables *MUST* additionally slot those variables. Subclasses violating
+    # this constraint will be usable but unslotted, which defeats our purposes.
+    #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+    # Slot all instance variables defined on this object to reduce the space
+    # and time costs of the thousands of instances of this class and subclasses
+    # thereof instantiated at test collection time.
+    __slots__ = (
+        'conf',
+        'hint',
+        'is_ignorable',
+        'is_needs_cls_stack',
+        'is_supported',
+        'piths_meta',
+    )
+
     # ..................{ INITIALIZERS                       }..................
     def __init__(
         self,
@@ -326,6 +378,21 @@ class HintPepMetadata(HintNonpepMetadata):
     :meth:`HintNonpepMetadata.__init__` method.
     '''
 
+    # ..................{ CLASS VARIABLES                    }..................
+    # Slot all instance variables defined on this object.
+    __slots__ = (
+        'generic_type',
+        'is_args',
+        'is_pep585_builtin',
+        'is_pep585_generic',
+        'is_type_typing',
+        'is_typevars',
+        'is_typing',
+        'isinstanceable_type',
+        'pep_sign',
+        'typehint_cls',
+    )
+
     # ..................{ INITIALIZERS                       }..................
     def __init__(
         self,
@@ -415,8 +482,6 @@ class HintPepMetadata(HintNonpepMetadata):
             f'{repr(is_typing)} not bool.')
         assert isinstance(generic_type, _NoneTypeOrType), (
             f'{repr(generic_type)} neither class nor "None".')
-        assert isinstance(generic_type, _NoneTypeOrType), (
-            f'{repr(generic_type)} neither class nor "None".')
         assert (
             typehint_cls is None or (
                 isinstance(typehint_cls, type) and